@@ -0,0 +1,107 @@
+import argparse
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+from reframe_tests.common import hockney
+
+SIZE_LINE = re.compile(r'^(\d+)\s+(\d+\.\d+)\s*$', re.MULTILINE)
+
+def load_sweeps(report_file):
+    """
+    Reads the osu_latency sweeps of all Hockney test cases in a ReFrame run report
+    (written with --report-file). Retried test cases appear in several runs of the
+    report; only their last result is kept. Returns a list of
+    (key, label, result, eager_threshold, sizes, times), where the key identifies
+    the test case and the label is (system:partition, display name).
+    """
+    with open(report_file, 'r') as f:
+        report = json.load(f)
+
+    last_attempts = {}
+    for run in report['runs']:
+        for testcase in run['testcases']:
+            if 'eager_threshold' in testcase:
+                # The unique name tells apart the variants of --repeat and -P
+                key = (testcase['unique_name'], testcase['system'], testcase['partition'], testcase['environ'])
+                last_attempts[key] = testcase
+
+    sweeps = []
+    for key, testcase in last_attempts.items():
+        if testcase.get('job_stdout') is None:
+            continue
+
+        # Failed test cases are not copied to the output directory
+        stdout_path = os.path.join(testcase['outputdir'], testcase['job_stdout'])
+        if not os.path.exists(stdout_path):
+            stdout_path = os.path.join(testcase['stagedir'], testcase['job_stdout'])
+        if not os.path.exists(stdout_path):
+            continue
+
+        with open(stdout_path, 'r') as f:
+            points = [(int(m), float(t)) for m, t in SIZE_LINE.findall(f.read())]
+
+        if points:
+            label = (f"{testcase['system']}:{testcase['partition']}", testcase['display_name'])
+            sizes, times = zip(*points)
+            sweeps.append((key, label, testcase['result'], testcase['eager_threshold'], sizes, times))
+
+    return sweeps
+
+def fit_all(sweeps):
+    """
+    Fits every sweep in one vectorized call per group of sweeps that share the
+    message sizes and eager threshold. Returns {key: (label, result, alpha, beta, resid)},
+    alpha, beta and resid being arrays with one entry per segment.
+    """
+    groups = defaultdict(list)
+    for key, label, result, eager_threshold, sizes, times in sweeps:
+        groups[(eager_threshold, sizes)].append((key, label, result, times))
+
+    results = {}
+    for (eager_threshold, sizes), series in groups.items():
+        keys, labels, test_results, times = zip(*series)
+        masks = hockney.segment_masks(sizes, eager_threshold)
+        alpha, beta, resid = hockney.fit_hockney(sizes, np.array(times), masks)
+        for i, key in enumerate(keys):
+            results[key] = (labels[i], test_results[i], alpha[i], beta[i], resid[i])
+
+    return results
+
+def print_table(results):
+    """
+    Prints the fitted parameters of each series, one row per series. The result
+    column is the ReFrame result of the test case; the sweep of a failed case
+    may be incomplete.
+    """
+    width = max(len(label[1]) for label, *_ in results.values())
+    header = f"{'system':<12} {'test':<{width}} {'result':<6}"
+    for segment in hockney.SEGMENTS:
+        header += f" {'alpha_' + segment + ' [us]':>17} {'beta_' + segment + ' [MB/s]':>18} {'resid_' + segment + ' [%]':>15}"
+    print(header)
+
+    for (system, test), result, alpha, beta, resid in sorted(results.values(), key=lambda r: r[0]):
+        row = f"{system:<12} {test:<{width}} {result:<6}"
+        for k in range(len(hockney.SEGMENTS)):
+            row += f" {alpha[k]:>17.3f} {beta[k]:>18.1f} {resid[k]:>15.2f}"
+        print(row)
+
+def main():
+    """Main function to parse arguments and fit all series."""
+    parser = argparse.ArgumentParser(description="Fit the Hockney model to all osu_latency sweeps of a reframe run.")
+    parser.add_argument("report_file", help="Path to the JSON run report written with reframe --report-file.")
+    args = parser.parse_args()
+
+    sweeps = load_sweeps(args.report_file)
+    if not sweeps:
+        sys.exit(f"No Hockney sweeps found in {args.report_file}")
+
+    print_table(fit_all(sweeps))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+'''Hockney (alpha-beta) model fitting for OSU latency sweeps.
+
+The model is t(m) = alpha + m / beta, with t in us and m in bytes, so that
+beta comes out in bytes/us, i.e. MB/s. The sweep is split into segments
+(eager and rendezvous protocol) and each segment gets its own fit.
+'''
+import numpy as np
+
+SEGMENTS = ('eager', 'rndv')
+
+
+def segment_masks(sizes, eager_threshold):
+    '''Boolean masks of shape (len(SEGMENTS), n) selecting each segment.
+
+    Messages up to and including ``eager_threshold`` are sent eagerly, larger
+    ones use the rendezvous protocol.
+    '''
+    sizes = np.asarray(sizes)
+    eager = sizes <= eager_threshold
+    return np.stack([eager, ~eager])
+
+
+def fit_hockney(sizes, times, masks):
+    '''Weighted least-squares fit of t(m) = alpha + m / beta.
+
+    ``sizes`` has shape (n,), ``times`` has shape (..., n) so that any number
+    of series (placements, sources, ...) can be fitted in one call, and
+    ``masks`` has shape (k, n), one row per segment. Points are weighted by
+    1/t**2, so the fit minimises relative rather than absolute error and the
+    small messages are not swamped by the large ones.
+
+    Returns ``(alpha, beta, resid)``, each of shape (..., k): the startup cost
+    in us, the asymptotic bandwidth in MB/s and the RMS relative residual of
+    the fit in %. A segment whose fitted slope is not positive has no
+    meaningful bandwidth; its beta is ``nan`` so that it fails any reference.
+    '''
+    m = np.asarray(sizes, dtype=float)
+    t = np.asarray(times, dtype=float)[..., np.newaxis, :]
+    mask = np.asarray(masks, dtype=float)
+    w = mask / t**2
+
+    w_sum = w.sum(axis=-1)
+    m_mean = (w * m).sum(axis=-1) / w_sum
+    t_mean = (w * t).sum(axis=-1) / w_sum
+    dm = m - m_mean[..., np.newaxis]
+    dt = t - t_mean[..., np.newaxis]
+    slope = (w * dm * dt).sum(axis=-1) / (w * dm**2).sum(axis=-1)
+    alpha = t_mean - slope * m_mean
+
+    rel_err = (t - alpha[..., np.newaxis] - slope[..., np.newaxis] * m) / t
+    resid = 100 * np.sqrt((mask * rel_err**2).sum(axis=-1) / mask.sum(axis=-1))
+    with np.errstate(divide='ignore'):
+        beta = np.where(slope > 0, 1 / slope, np.nan)
+
+    return alpha, beta, resid
@@ -0,0 +1,92 @@
+import reframe as rfm
+import reframe.utility.sanity as sn
+
+from . import hockney
+from .osu_placement import OsuPlacementMixin
+
+class OsuHockneyBase(rfm.RunOnlyRegressionTest, OsuPlacementMixin):
+    '''Base class for the OSU Hockney model tests. NOT MEANT TO BE RUN DIRECTLY.
+
+    Runs an osu_latency sweep and fits t(m) = alpha + m/beta separately to the
+    eager and rendezvous parts of it. The fitted alpha, beta and fit residual
+    of each segment are reported as performance variables.
+    '''
+    valid_systems = ['aion:batch', 'iris:batch']
+    valid_prog_environs = ['foss-2023b']
+    tags = {'performance', 'latency', 'hockney', 'placement'}
+
+    num_tasks = 2
+    exclusive_access = True
+    executable = 'osu_latency'
+
+    min_msg_size = variable(int, value=1)
+    max_msg_size = variable(int, value=4194304)
+    # Largest message still sent eagerly, i.e. where the piecewise fit is split
+    eager_threshold = variable(int, value=8192)
+
+    placement = parameter(['same_core', 'same_numa', 'diff_numa', 'diff_node'])
+
+    @run_after('init')
+    def setup_hockney_fit(self):
+        self.executable_opts = ['-m', f'{self.min_msg_size}:{self.max_msg_size}', '-x', '100', '-i', '1000']
+        self.hockney_fit = None
+        self.perf_variables = {
+            f'{quantity}_{segment}': sn.make_performance_function(self.hockney_param, unit, segment, quantity)
+            for segment in hockney.SEGMENTS
+            for quantity, unit in [('alpha', 'us'), ('beta', 'MB/s'), ('resid', '%')]
+        }
+
+    @sanity_function
+    def validate_sweep(self):
+        sizes = sn.extractall(r'^(\d+)\s+\d+\.\d+', self.stdout, 1, int)
+        return sn.all([
+            sn.assert_found(rf'^{self.max_msg_size}\s+\d+\.\d+', self.stdout),
+            sn.assert_ge(sn.count(sn.filter(lambda m: m <= self.eager_threshold, sizes)), 2),
+            sn.assert_ge(sn.count(sn.filter(lambda m: m > self.eager_threshold, sizes)), 2),
+            self.assert_positive_slopes()
+        ])
+
+    @sn.deferrable
+    def assert_positive_slopes(self):
+        # A non-positive slope gives beta=nan, which must fail even where beta
+        # has no reference
+        for segment in hockney.SEGMENTS:
+            sn.evaluate(sn.assert_true(
+                self.hockney_param(segment, 'beta') > 0,
+                f'degenerate Hockney fit: non-positive slope in the {segment} segment'
+            ))
+
+        return True
+
+    def hockney_param(self, segment, quantity):
+        # All perf variables share one fit of the sweep, done on first use
+        if self.hockney_fit is None:
+            sizes, times = zip(*sn.evaluate(
+                sn.extractall(r'^(\d+)\s+(\S+)', self.stdout, (1, 2), (int, float))
+            ))
+            masks = hockney.segment_masks(sizes, self.eager_threshold)
+            self.hockney_fit = dict(zip(['alpha', 'beta', 'resid'], hockney.fit_hockney(sizes, times, masks)))
+
+        return float(self.hockney_fit[quantity][hockney.SEGMENTS.index(segment)])
+
+    @run_before('performance')
+    def set_reference_values(self):
+        # alpha_eager, beta_eager and alpha_rndv are only reported until a real
+        # sweep gives them references. beta_rndv, the asymptotic ping-pong
+        # bandwidth, is loosely bounded by the windowed 1 MB bandwidth
+        # references of OsuBandwidthPlacementTest.
+        bandwidth_1m = {
+            'aion:batch': {'same_core': 14545.6, 'same_numa': 12649.5, 'diff_numa': 12664.8, 'diff_node': 12323.0},
+            'iris:batch': {'same_core': 15000.0, 'same_numa': 13000.0, 'diff_numa': 12000.0, 'diff_node': 8372.26}
+        }
+        sys_name = self.current_partition.fullname
+
+        # The fit residuals are capped: reference at the cap, upper threshold 0
+        resid_cap = (10.0, None, 0.0, '%')
+        self.reference = {
+            sys_name: {
+                'resid_eager': resid_cap,
+                'beta_rndv': (bandwidth_1m[sys_name][self.placement], -0.5, None, 'MB/s'),
+                'resid_rndv': resid_cap
+            }
+        }
@@ -1,7 +1,9 @@
 import reframe as rfm
 import reframe.utility.sanity as sn
 
-class OsuPerformanceBase(rfm.RunOnlyRegressionTest):
+from .osu_placement import OsuPlacementMixin
+
+class OsuPerformanceBase(rfm.RunOnlyRegressionTest, OsuPlacementMixin):
     '''Base class for OSU Latency and Bandwidth tests. NOT MEANT TO BE RUN DIRECTLY.'''
     valid_systems = ['aion:batch', 'iris:batch']
     
@@ -26,24 +28,6 @@ class OsuPerformanceBase(rfm.RunOnlyRegressionTest):
             )
         }
         
-    @run_before('run')
-    def set_placement(self):
-        placement_desc = {
-            'same_core': 'on the same core', 'same_numa': 'on the same NUMA node',
-            'diff_numa': 'on different NUMA nodes', 'diff_node': 'on different compute nodes'
-        }
-        self.descr += f' ({placement_desc[self.placement]})'
-        if self.placement == 'diff_node':
-            self.num_nodes = 2
-            self.num_tasks_per_node = 1
-        else:
-            self.num_nodes = 1
-            self.num_tasks_per_node = 2
-
-        if self.placement == 'same_core': self.job.launcher.options = ['--cpu-bind=core', '--ntasks-per-core=2']
-        elif self.placement == 'same_numa': self.job.launcher.options = ['--cpu-bind=cores']
-        elif self.placement == 'diff_numa': self.job.launcher.options = ['--cpu-bind=sockets']
-
     @sanity_function
     def validate_output(self):
         return sn.assert_found(rf'^{self.msg_size}\s+\d+\.\d+', self.stdout)
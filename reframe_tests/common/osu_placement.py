@@ -0,0 +1,26 @@
+import reframe as rfm
+
+class OsuPlacementMixin(rfm.RegressionMixin):
+    '''Runs the two OSU processes on the same core, NUMA node, socket or on different nodes.
+
+    Tests using it declare the ``placement`` parameter themselves, so that its
+    position among their other parameters, and thus their names, stay as they are.
+    '''
+
+    @run_before('run')
+    def set_placement(self):
+        placement_desc = {
+            'same_core': 'on the same core', 'same_numa': 'on the same NUMA node',
+            'diff_numa': 'on different NUMA nodes', 'diff_node': 'on different compute nodes'
+        }
+        self.descr += f' ({placement_desc[self.placement]})'
+        if self.placement == 'diff_node':
+            self.num_nodes = 2
+            self.num_tasks_per_node = 1
+        else:
+            self.num_nodes = 1
+            self.num_tasks_per_node = 2
+
+        if self.placement == 'same_core': self.job.launcher.options = ['--cpu-bind=core', '--ntasks-per-core=2']
+        elif self.placement == 'same_numa': self.job.launcher.options = ['--cpu-bind=cores']
+        elif self.placement == 'diff_numa': self.job.launcher.options = ['--cpu-bind=sockets']
@@ -0,0 +1,53 @@
+
+# ReFrame configuration for running the suite offline on a local machine.
+#
+# Mimics the aion and iris batch partitions, but jobs run through the local
+# scheduler and the srun, wget, eb and OSU binaries are the stand-ins from
+# reframe_tests/mock/bin. No cluster, modules or network access is needed.
+
+import os
+
+_MOCK_BIN = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'mock', 'bin')
+
+def _mock_partition(system):
+    return {
+        'name': 'batch',
+        'descr': 'Local mock of the batch partition',
+        'scheduler': 'local',
+        'launcher': 'srun',
+        # The EESSI tests load their modules by hand
+        'prepare_cmds': ['module() { :; }'],
+        # Selects the per-system model of the fake OSU binaries
+        'env_vars': [['MOCK_OSU_SYSTEM', system]],
+        'environs': ['foss-2023b'],
+        'max_jobs': 8
+    }
+
+site_configuration = {
+  'systems': [
+    {
+      'name': 'aion',
+      'descr': 'Aion cluster (local mock)',
+      'hostnames': [r'.*'],
+      'modules_system': 'nomod',
+      'partitions': [_mock_partition('aion')]
+    },
+    {
+      'name': 'iris',
+      'descr': 'Iris cluster (local mock)',
+      'hostnames': [r'.*'],
+      'modules_system': 'nomod',
+      'partitions': [_mock_partition('iris')]
+    }
+  ],
+
+  'environments': [
+    {
+      'name': 'foss-2023b',
+      'env_vars': [['PATH', f'{_MOCK_BIN}:$PATH']],
+      'cc': 'mpicc',
+      'cxx': 'mpicxx',
+      'ftn': 'mpifort',
+    },
+  ],
+}
@@ -0,0 +1,13 @@
+import reframe as rfm
+from ..common.osu_hockney_base import OsuHockneyBase
+from .osu_performance import OsuBuildEasyBuild
+
+@rfm.simple_test
+class OsuHockneyEasyBuildTest(OsuHockneyBase):
+    '''Fits the Hockney model to osu_latency built with EasyBuild.'''
+    descr = 'OSU Hockney Fit (Source: EasyBuild)'
+    osu_build = fixture(OsuBuildEasyBuild, scope='environment')
+
+    @run_before('run')
+    def set_modules_from_easybuild(self):
+        self.modules = self.osu_build.generated_modules
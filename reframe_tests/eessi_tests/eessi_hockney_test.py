@@ -0,0 +1,15 @@
+import reframe as rfm
+from ..common.osu_hockney_base import OsuHockneyBase
+
+@rfm.simple_test
+class EessiHockneyTest(OsuHockneyBase):
+    '''Fits the Hockney model to osu_latency from the EESSI binaries.'''
+    descr = 'OSU Hockney Fit (Source: EESSI)'
+    tags = {'performance', 'latency', 'hockney', 'placement', 'eessi'}
+
+    @run_before('run')
+    def set_modules_from_eessi(self):
+        self.prerun_cmds = [
+            'module load EESSI/2023.06',
+            'module load OSU-Micro-Benchmarks/7.2-gompi-2023b'
+        ]
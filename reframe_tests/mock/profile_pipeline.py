@@ -0,0 +1,198 @@
+'''Profiles the ReFrame side of the suite offline, on the local mock system.
+
+For each matrix size, the run-only tests are replicated with ReFrame's -P
+option and the suite is run against reframe_tests/configs/mock_config.py.
+The timings of test loading, generation and fixture/dependency resolution are
+read from ReFrame's profiler report of --list -vv. They are the median of
+several repeats, after one discarded warm-up --list that absorbs the cold
+import and bytecode costs. A final --run gives the per-phase pipeline times
+from the ReFrame run report.
+
+The -P copies are generated by ReFrame's parameterize_tests step, so the
+growth of the matrix shows up there and in dependency resolution. load_all and
+instantiate_all stay flat, and the build fixtures are not multiplied. Growth
+through real class parameters (placements, sources, sizes) is not measured.
+
+Usage:
+    python reframe_tests/mock/profile_pipeline.py --copies 1 4 16
+'''
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+_THIS_FILE_DIR = os.path.dirname(os.path.realpath(__file__))
+_TESTS_DIR = os.path.join(_THIS_FILE_DIR, '..')
+
+CONFIG_FILE = os.path.join(_TESTS_DIR, 'configs', 'mock_config.py')
+CHECK_PATHS = ['source', 'easybuild_tests', 'eessi_tests']
+
+# Only the run-only tests are replicated: the build tests keep their names,
+# so that depends_on('OsuBuildSource') and the EasyBuild fixture still resolve
+SCALED_TESTS = [
+    'OsuLatencyPlacementTest', 'OsuBandwidthPlacementTest', 'OsuHockneySourceTest',
+    'OsuPerformanceTest', 'OsuHockneyEasyBuildTest', 'EessiOsuTest', 'EessiHockneyTest'
+]
+PHASES = ['setup', 'compile', 'run', 'sanity', 'performance', 'total']
+
+# Entries of the profiler report printed by reframe -vv; main is ReFrame's own
+# total, i.e. the --list wall time without interpreter startup, and
+# parameterize_tests is the re-instantiation caused by the -P options
+LIST_PHASES = [
+    'main', 'load_all', 'instantiate_all', 'generate_testcases', 'parameterize_tests',
+    'build_deps', 'validate_deps', 'prune_deps', 'toposort'
+]
+PROFILER_ENTRY = re.compile(r'^\s*(\S+): (\d+\.\d+) s$')
+
+
+def reframe_command(system, prefix, copies):
+    cmd = ['reframe', '-C', CONFIG_FILE, '--system', system, '--prefix', prefix]
+    for path in CHECK_PATHS:
+        cmd += ['-c', os.path.join(_TESTS_DIR, path)]
+
+    if copies > 1:
+        # max_pending_time has no effect on the local scheduler
+        durations = ','.join(f'{i + 1}s' for i in range(copies))
+        for test in SCALED_TESTS:
+            cmd += ['-P', f'{test}.max_pending_time={durations}']
+
+    return cmd
+
+
+def timed_run(cmd, log_file):
+    '''Runs cmd with its output sent to log_file; returns (wall time, exit code).'''
+    start = time.perf_counter()
+    with open(log_file, 'w') as log:
+        completed = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT)
+
+    return time.perf_counter() - start, completed.returncode
+
+
+def parse_profiler_report(log_file):
+    '''Returns {phase: seconds} from the profiler report block of a reframe -vv log.'''
+    with open(log_file) as fp:
+        lines = fp.read().splitlines()
+
+    try:
+        start = lines.index('>>> profiler report [start] <<<')
+        end = lines.index('>>> profiler report [ end ] <<<', start)
+    except ValueError:
+        raise RuntimeError(f'no profiler report found; see {log_file}') from None
+
+    timings = {}
+    for line in lines[start + 1:end]:
+        match = PROFILER_ENTRY.match(line)
+        if match:
+            # e.g. 'RegressionCheckLoader.load_all' -> 'load_all'. Only the first
+            # entry of a phase is kept: later ones are nested in parameterize_tests
+            phase = match.group(1).rsplit('.', 1)[-1]
+            if phase in LIST_PHASES:
+                timings.setdefault(phase, float(match.group(2)))
+
+    return {phase: timings.get(phase, 0.0) for phase in LIST_PHASES}
+
+
+def list_checks(cmd, log_file):
+    '''Runs cmd with --list -vv; returns (wall time, {phase: seconds}).'''
+    wall_time, returncode = timed_run(cmd + ['--list', '-vv'], log_file)
+    if returncode != 0:
+        raise RuntimeError(f'reframe --list failed with exit code {returncode}; see {log_file}')
+
+    return wall_time, parse_profiler_report(log_file)
+
+
+def profile(system, prefix, copies, list_repeats):
+    '''Profiles one matrix size and returns a dict of timings in seconds.'''
+    prefix = os.path.join(prefix, f'copies_{copies}')
+    os.makedirs(prefix, exist_ok=True)
+    cmd = reframe_command(system, prefix, copies)
+    report_file = os.path.join(prefix, 'report.json')
+
+    list_runs = [list_checks(cmd, os.path.join(prefix, f'list_{i}.log')) for i in range(list_repeats)]
+    list_time = statistics.median(wall_time for wall_time, _ in list_runs)
+    list_phases = {
+        phase: statistics.median(timings[phase] for _, timings in list_runs)
+        for phase in LIST_PHASES
+    }
+
+    # A non-zero exit code of --run only means that some test failed; the
+    # failures are counted from the report
+    run_log = os.path.join(prefix, 'run.log')
+    run_time, returncode = timed_run(cmd + ['--run', '--report-file', report_file], run_log)
+    try:
+        with open(report_file) as fp:
+            report = json.load(fp)
+    except (OSError, json.JSONDecodeError) as err:
+        raise RuntimeError(f'reframe --run (exit code {returncode}) left no valid report: {err}; '
+                           f'see {run_log}') from None
+
+    testcases = report['runs'][-1]['testcases']
+    result = {
+        'cases': len(testcases),
+        'failures': report['session_info']['num_failures'],
+        'list_wall': list_time,
+        'run_wall': run_time,
+        'list_phases': list_phases
+    }
+    for phase in PHASES:
+        times = [tc[f'time_{phase}'] for tc in testcases if tc.get(f'time_{phase}') is not None]
+        result[phase] = sum(times) / len(times) if times else 0.0
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile the ReFrame pipeline overhead on the mock system.')
+    parser.add_argument('--copies', type=int, nargs='+', default=[1, 4, 16],
+                        help='Number of copies of each run-only test case (one profile per value)')
+    parser.add_argument('--list-repeats', type=int, default=5,
+                        help='Number of --list runs per matrix size; their median is reported')
+    parser.add_argument('--system', default='aion:batch', help='Mock system to run on (aion:batch or iris:batch)')
+    parser.add_argument('--prefix', help='Directory for stage, output, logs and reports (default: a temporary directory)')
+    args = parser.parse_args()
+
+    prefix = args.prefix or tempfile.mkdtemp(prefix='omb-profile-')
+    os.makedirs(prefix, exist_ok=True)
+    print(f'Writing logs and reports to {prefix}')
+
+    results = []
+    try:
+        # Discarded, so that the first matrix size does not pay for cold imports
+        list_checks(reframe_command(args.system, prefix, 1), os.path.join(prefix, 'warmup.log'))
+        for copies in args.copies:
+            print(f'Profiling {copies} cop{"y" if copies == 1 else "ies"} of each run-only test...', flush=True)
+            results.append((copies, profile(args.system, prefix, copies, args.list_repeats)))
+    except RuntimeError as err:
+        print(f'ERROR: {err}', file=sys.stderr)
+        return 1
+
+    print(f'\nTest loading, generation and dependency resolution (reframe --list -vv, '
+          f'median of {args.list_repeats} after a warm-up).')
+    print('Copies come from -P (parameterize_tests); growth from real class parameters is not measured:')
+    header = f"{'copies':>6} {'cases':>6} {'wall [s]':>9}"
+    header += ''.join(f' {phase + " [ms]":>{max(len(phase) + 5, 10)}}' for phase in LIST_PHASES)
+    print(header)
+    for copies, res in results:
+        row = f"{copies:>6} {res['cases']:>6} {res['list_wall']:>9.2f}"
+        row += ''.join(f' {1000 * res["list_phases"][phase]:>{max(len(phase) + 5, 10)}.1f}' for phase in LIST_PHASES)
+        print(row)
+
+    print('\nTest pipeline (reframe --run), mean time per test case from the run report:')
+    header = f"{'copies':>6} {'cases':>6} {'fail':>5} {'wall [s]':>9}"
+    header += ''.join(f' {phase + " [ms]":>{max(len(phase) + 5, 10)}}' for phase in PHASES)
+    print(header)
+    for copies, res in results:
+        row = f"{copies:>6} {res['cases']:>6} {res['failures']:>5} {res['run_wall']:>9.2f}"
+        row += ''.join(f' {1000 * res[phase]:>{max(len(phase) + 5, 10)}.1f}' for phase in PHASES)
+        print(row)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,20 @@
+import os
+import reframe as rfm
+from ..common.osu_hockney_base import OsuHockneyBase
+
+@rfm.simple_test
+class OsuHockneySourceTest(OsuHockneyBase):
+    '''Fits the Hockney model to osu_latency compiled from source.'''
+    descr = 'OSU Hockney Fit (Source: compiled from source)'
+    maintainers = ['jurmy']
+
+    @run_after('init')
+    def set_dependencies(self):
+        self.depends_on('OsuBuildSource')
+
+    @run_before('run')
+    def set_executable(self):
+        build_fixture = self.getdep('OsuBuildSource')
+        benchmark_bin_path = os.path.join(build_fixture.stagedir, 'install', 'libexec',
+                                          'osu-micro-benchmarks', 'mpi', 'pt2pt')
+        self.executable = os.path.join(benchmark_bin_path, 'osu_latency')